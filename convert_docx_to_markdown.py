@@ -12,11 +12,64 @@ Convert .docx files to .md with formatting preservation but NO italic:
 import os
 import sys
 import re
-import shutil
+from collections import defaultdict
 from pathlib import Path
 from zipfile import ZipFile
-import xml.etree.ElementTree as ET
 import hashlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout, redirect_stderr
+
+# Prefer lxml's C parser when available; fall back to the standard library
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Namespace URIs and the Clark-notation names looked up on every element
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+W_BODY = f'{{{W}}}body'
+W_P = f'{{{W}}}p'
+W_TBL = f'{{{W}}}tbl'
+W_TR = f'{{{W}}}tr'
+W_TC = f'{{{W}}}tc'
+# Elements that may wrap table rows and cells (content controls, custom XML)
+TABLE_WRAPPERS = frozenset({f'{{{W}}}sdt', f'{{{W}}}sdtContent', f'{{{W}}}customXml'})
+W_PPR = f'{{{W}}}pPr'
+W_R = f'{{{W}}}r'
+W_RPR = f'{{{W}}}rPr'
+W_B = f'{{{W}}}b'
+W_T = f'{{{W}}}t'
+W_DRAWING = f'{{{W}}}drawing'
+A_BLIP = f'{{{A}}}blip'
+W_PSTYLE = f'{{{W}}}pStyle'
+W_NUMPR = f'{{{W}}}numPr'
+W_STYLE = f'{{{W}}}style'
+W_NAME = f'{{{W}}}name'
+W_ABSTRACT_NUM = f'{{{W}}}abstractNum'
+W_LVL = f'{{{W}}}lvl'
+W_NUM_FMT = f'{{{W}}}numFmt'
+W_NUM = f'{{{W}}}num'
+# Used both as element and attribute names
+W_ABSTRACT_NUM_ID = f'{{{W}}}abstractNumId'
+W_NUM_ID = f'{{{W}}}numId'
+W_ILVL = f'{{{W}}}ilvl'
+W_VAL = f'{{{W}}}val'
+W_STYLE_ID = f'{{{W}}}styleId'
+W_TYPE = f'{{{W}}}type'
+R_EMBED = f'{{{R}}}embed'
+
+# Package parts the converter reads straight from the .docx archive
+DOCUMENT_PART = 'word/document.xml'
+STYLES_PART = 'word/styles.xml'
+NUMBERING_PART = 'word/numbering.xml'
+RELS_PART = 'word/_rels/document.xml.rels'
+# Images directly under word/media/, split into file name, stem and suffix
+MEDIA_RE = re.compile(r'^word/media/(([^/]+)(\.(?:png|jpe?g|gif|bmp)))$', re.IGNORECASE)
 
 class DocxToMarkdownConverter:
     def __init__(self, source_dir, output_dir, images_dir):
@@ -24,11 +77,11 @@ class DocxToMarkdownConverter:
         self.output_dir = Path(output_dir)
         self.images_dir = Path(images_dir)
         self.namespaces = {
-            'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+            'w': W,
             'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing',
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+            'a': A,
             'pic': 'http://schemas.openxmlformats.org/drawingml/2006/picture',
-            'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+            'r': R
         }
         self.styles = {}  # Will store style definitions
         self.numbering = {}  # Will store numbering definitions
@@ -39,45 +92,52 @@ class DocxToMarkdownConverter:
         content_elements = []
         image_mapping = {}
         
-        # Create temp directory
-        temp_dir = Path("temp_docx_extract")
-        temp_dir.mkdir(exist_ok=True)
-        
-        try:
-            # Extract the .docx file
-            with ZipFile(docx_path, 'r') as zip_file:
-                zip_file.extractall(temp_dir)
+        # Everything is read straight from the archive; nothing is unpacked to disk
+        with ZipFile(docx_path, 'r') as zip_file:
+            part_names = set(zip_file.namelist())
+            
+            # Extract all images and create mapping
+            doc_name = docx_path.stem.replace(" ", "_").replace(":", "")
+            for name in zip_file.namelist():
+                media = MEDIA_RE.match(name)
+                if media:
+                    image_name, image_stem, image_suffix = media.groups()
+                    
+                    # Stream the image out of the archive, hashing it in the same pass
+                    part_path = self.images_dir / f".{doc_name}_{image_name}.part"
+                    hasher = hashlib.md5()
+                    try:
+                        with zip_file.open(name) as src, open(part_path, 'wb') as dst:
+                            for chunk in iter(lambda: src.read(1 << 16), b''):
+                                hasher.update(chunk)
+                                dst.write(chunk)
+                        
+                        # Generate unique filename
+                        image_hash = hasher.hexdigest()[:8]
+                        new_filename = f"{doc_name}_{image_stem}_{image_hash}{image_suffix}"
+                        os.replace(part_path, self.images_dir / new_filename)
+                    except BaseException:
+                        # Never leave a partial image behind in images_dir
+                        if part_path.exists():
+                            part_path.unlink()
+                        raise
+                    
+                    # Store mapping
+                    image_mapping[image_name] = new_filename
+                    print(f"  Extracted image: {new_filename}")
             
             # First, load styles
-            self._load_styles(temp_dir)
+            if STYLES_PART in part_names:
+                self._load_styles(zip_file)
             
             # Load numbering definitions
-            self._load_numbering(temp_dir)
-            
-            # Extract all images and create mapping
-            media_path = temp_dir / "word" / "media"
-            if media_path.exists():
-                for image_file in media_path.iterdir():
-                    if image_file.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp']:
-                        # Generate unique filename
-                        doc_name = docx_path.stem.replace(" ", "_").replace(":", "")
-                        image_hash = hashlib.md5(image_file.read_bytes()).hexdigest()[:8]
-                        new_filename = f"{doc_name}_{image_file.stem}_{image_hash}{image_file.suffix}"
-                        dest_path = self.images_dir / new_filename
-                        
-                        # Copy the image
-                        shutil.copy2(image_file, dest_path)
-                        
-                        # Store mapping
-                        image_mapping[image_file.name] = new_filename
-                        print(f"  Extracted image: {new_filename}")
+            if NUMBERING_PART in part_names:
+                self._load_numbering(zip_file)
             
             # Parse relationships to map rId to image files
-            rels_path = temp_dir / "word" / "_rels" / "document.xml.rels"
             rid_to_image = {}
-            if rels_path.exists():
-                rels_tree = ET.parse(rels_path)
-                rels_root = rels_tree.getroot()
+            if RELS_PART in part_names:
+                rels_root = ET.fromstring(zip_file.read(RELS_PART))
                 for rel in rels_root:
                     if 'image' in rel.get('Type', ''):
                         rid = rel.get('Id')
@@ -88,77 +148,94 @@ class DocxToMarkdownConverter:
                                 rid_to_image[rid] = image_mapping[image_name]
             
             # Parse the main document
-            doc_path = temp_dir / "word" / "document.xml"
-            if doc_path.exists():
-                tree = ET.parse(doc_path)
-                root = tree.getroot()
-                
-                # Process all elements in order
-                body = root.find('.//w:body', self.namespaces)
-                if body is not None:
-                    for elem in body:
-                        if elem.tag == f"{{{self.namespaces['w']}}}p":
+            if DOCUMENT_PART in part_names:
+                # Stream the body so each top-level element is released once processed
+                body = None
+                depth = 0
+                with zip_file.open(DOCUMENT_PART) as doc_file:
+                    for event, elem in ET.iterparse(doc_file, events=('start', 'end')):
+                        if event == 'start':
+                            depth += 1
+                            if depth == 2 and elem.tag == W_BODY:
+                                body = elem
+                            continue
+                        
+                        # Only direct children of the body are complete units of content
+                        depth -= 1
+                        if body is None or depth != 2:
+                            continue
+                        
+                        if elem.tag == W_P:
                             # Process paragraph with formatting
                             self._process_paragraph_formatted(elem, content_elements, rid_to_image)
-                        elif elem.tag == f"{{{self.namespaces['w']}}}tbl":
+                        elif elem.tag == W_TBL:
                             # Process table
                             self._process_table(elem, content_elements)
-        
-        finally:
-            # Clean up temp directory
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                        
+                        elem.clear()
+                        body.remove(elem)
         
         return content_elements, image_mapping
     
-    def _load_styles(self, temp_dir):
+    def _load_styles(self, zip_file):
         """Load style definitions from styles.xml"""
-        styles_path = temp_dir / "word" / "styles.xml"
-        if styles_path.exists():
-            tree = ET.parse(styles_path)
-            root = tree.getroot()
-            
+        with zip_file.open(STYLES_PART) as styles_file:
             # Extract style definitions
-            for style in root.findall('.//w:style', self.namespaces):
-                style_id = style.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}styleId')
+            for _, style in ET.iterparse(styles_file):
+                if style.tag != W_STYLE:
+                    continue
+                style_id = style.get(W_STYLE_ID)
                 if style_id:
-                    name_elem = style.find('.//w:name', self.namespaces)
+                    name_elem = style.find(W_NAME)
                     if name_elem is not None:
-                        name = name_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', '')
+                        name = name_elem.get(W_VAL, '')
                         self.styles[style_id] = {
                             'name': name,
-                            'type': style.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}type', '')
+                            'type': style.get(W_TYPE, ''),
+                            'element_type': self._classify_style(name)
                         }
+                style.clear()
+    
+    def _classify_style(self, name):
+        """Map a style name to the content element type it produces"""
+        style_name = name.lower()
+        if 'title' in style_name:
+            return 'title'
+        elif 'heading 1' in style_name:
+            return 'heading1'
+        elif 'heading 2' in style_name:
+            return 'heading2'
+        elif 'heading 3' in style_name:
+            return 'heading3'
+        return 'text'
     
-    def _load_numbering(self, temp_dir):
+    def _load_numbering(self, zip_file):
         """Load numbering definitions from numbering.xml"""
-        numbering_path = temp_dir / "word" / "numbering.xml"
-        if numbering_path.exists():
-            tree = ET.parse(numbering_path)
-            root = tree.getroot()
-            
-            # Load abstract numbering definitions to determine list type
-            for abstractNum in root.findall('.//w:abstractNum', self.namespaces):
-                abstract_id = abstractNum.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}abstractNumId')
-                if abstract_id:
-                    # Check each level for numFmt (number format)
-                    levels = {}
-                    for lvl in abstractNum.findall('.//w:lvl', self.namespaces):
-                        ilvl = lvl.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ilvl')
-                        numFmt = lvl.find('.//w:numFmt', self.namespaces)
-                        if numFmt is not None:
-                            fmt = numFmt.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
-                            levels[int(ilvl)] = fmt
-                    self.abstract_nums[int(abstract_id)] = levels
-            
-            # Map numId to abstractNumId
-            for num in root.findall('.//w:num', self.namespaces):
-                num_id = num.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numId')
-                abstractNumId = num.find('.//w:abstractNumId', self.namespaces)
-                if num_id and abstractNumId is not None:
-                    abstract_id = abstractNumId.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
+        with zip_file.open(NUMBERING_PART) as numbering_file:
+            for _, elem in ET.iterparse(numbering_file):
+                if elem.tag == W_ABSTRACT_NUM:
+                    # Load abstract numbering definitions to determine list type
+                    abstract_id = elem.get(W_ABSTRACT_NUM_ID)
                     if abstract_id:
-                        self.numbering[int(num_id)] = int(abstract_id)
+                        # Check each level for numFmt (number format)
+                        levels = {}
+                        for lvl in elem.findall(W_LVL):
+                            ilvl = lvl.get(W_ILVL)
+                            numFmt = lvl.find(W_NUM_FMT)
+                            if numFmt is not None:
+                                fmt = numFmt.get(W_VAL)
+                                levels[int(ilvl)] = fmt
+                        self.abstract_nums[int(abstract_id)] = levels
+                    elem.clear()
+                elif elem.tag == W_NUM:
+                    # Map numId to abstractNumId
+                    num_id = elem.get(W_NUM_ID)
+                    abstractNumId = elem.find(W_ABSTRACT_NUM_ID)
+                    if num_id and abstractNumId is not None:
+                        abstract_id = abstractNumId.get(W_VAL)
+                        if abstract_id:
+                            self.numbering[int(num_id)] = int(abstract_id)
+                    elem.clear()
     
     def _get_list_type(self, numId, level):
         """Determine if a list is bulleted or numbered based on numId and level"""
@@ -177,28 +254,26 @@ class DocxToMarkdownConverter:
         # Default to numbered if we can't determine
         return 'numbered'
     
-    def _get_paragraph_style(self, paragraph):
-        """Get the style of a paragraph"""
-        pPr = paragraph.find('.//w:pPr', self.namespaces)
+    def _get_paragraph_style(self, pPr):
+        """Get the style of a paragraph from its w:pPr element"""
         if pPr is not None:
-            pStyle = pPr.find('.//w:pStyle', self.namespaces)
+            pStyle = pPr.find(W_PSTYLE)
             if pStyle is not None:
-                style_id = pStyle.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
+                style_id = pStyle.get(W_VAL)
                 if style_id in self.styles:
                     return self.styles[style_id]
         return None
     
-    def _get_numbering_info(self, paragraph):
-        """Get numbering information for a paragraph"""
-        pPr = paragraph.find('.//w:pPr', self.namespaces)
+    def _get_numbering_info(self, pPr):
+        """Get numbering information for a paragraph from its w:pPr element"""
         if pPr is not None:
-            numPr = pPr.find('.//w:numPr', self.namespaces)
+            numPr = pPr.find(W_NUMPR)
             if numPr is not None:
-                ilvl = numPr.find('.//w:ilvl', self.namespaces)
-                numId = numPr.find('.//w:numId', self.namespaces)
+                ilvl = numPr.find(W_ILVL)
+                numId = numPr.find(W_NUM_ID)
                 if ilvl is not None and numId is not None:
-                    level = ilvl.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', '0')
-                    num_id = numId.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', '0')
+                    level = ilvl.get(W_VAL, '0')
+                    num_id = numId.get(W_VAL, '0')
                     return {'level': int(level), 'numId': int(num_id)}
         return None
     
@@ -206,47 +281,39 @@ class DocxToMarkdownConverter:
         """Extract text with inline formatting (bold ONLY, no italic)"""
         formatted_text = []
         
-        for run in paragraph.findall('.//w:r', self.namespaces):
-            text_parts = []
-            
-            # Check for formatting
-            rPr = run.find('.//w:rPr', self.namespaces)
+        # Runs may sit inside hyperlinks and similar wrappers, so walk all descendants.
+        # Text-box runs are reached by this walk too; only each run's own w:t children
+        # are read, so text-box text appears once rather than also via its anchor run.
+        for run in paragraph.iter(W_R):
             is_bold = False
             # We'll ignore italic formatting completely
             
-            if rPr is not None:
-                # Check for bold
-                b = rPr.find('.//w:b', self.namespaces)
-                if b is not None:
-                    val = b.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', 'true')
-                    is_bold = val != 'false'
-            
-            # Extract text
-            for text_elem in run.findall('.//w:t', self.namespaces):
-                if text_elem.text:
-                    text = text_elem.text
-                    
-                    # Apply formatting - ONLY BOLD
-                    if is_bold:
-                        text = f"**{text}**"
-                    # No italic formatting applied
-                    
-                    text_parts.append(text)
-            
-            if text_parts:
-                formatted_text.append(''.join(text_parts))
+            # w:rPr always precedes the run's text, so plain text goes straight to the output
+            for child in run:
+                tag = child.tag
+                if tag == W_T:
+                    text = child.text
+                    if text:
+                        # Apply formatting - ONLY BOLD
+                        formatted_text.append(f"**{text}**" if is_bold else text)
+                elif tag == W_RPR:
+                    # Check for bold
+                    b = child.find(W_B)
+                    if b is not None:
+                        val = b.get(W_VAL, 'true')
+                        is_bold = val != 'false'
         
         return ''.join(formatted_text)
     
     def _process_paragraph_formatted(self, paragraph, content_elements, rid_to_image):
         """Process a paragraph element with formatting preservation"""
-        # Check if paragraph contains an image
-        drawing = paragraph.find('.//w:drawing', self.namespaces)
+        # Check if paragraph contains an image (stop at the first one)
+        drawing = next(paragraph.iter(W_DRAWING), None)
         if drawing is not None:
             # Extract image reference
-            blip = drawing.find('.//a:blip', self.namespaces)
+            blip = next(drawing.iter(A_BLIP), None)
             if blip is not None:
-                embed_id = blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
+                embed_id = blip.get(R_EMBED)
                 if embed_id and embed_id in rid_to_image:
                     image_filename = rid_to_image[embed_id]
                     content_elements.append({
@@ -259,11 +326,14 @@ class DocxToMarkdownConverter:
         text = self._extract_text_with_formatting(paragraph)
         
         if text or drawing is None:
+            # Paragraph properties are shared by the style and numbering lookups
+            pPr = paragraph.find(W_PPR)
+            
             # Get paragraph style
-            style = self._get_paragraph_style(paragraph)
+            style = self._get_paragraph_style(pPr)
             
             # Check for numbering
-            numbering = self._get_numbering_info(paragraph)
+            numbering = self._get_numbering_info(pPr)
             
             # Determine element type and formatting
             element = {
@@ -272,17 +342,9 @@ class DocxToMarkdownConverter:
                 'formatting': {}
             }
             
-            # Apply style-based formatting
+            # Apply style-based formatting (classified once when styles are loaded)
             if style:
-                style_name = style.get('name', '').lower()
-                if 'title' in style_name:
-                    element['type'] = 'title'
-                elif 'heading 1' in style_name:
-                    element['type'] = 'heading1'
-                elif 'heading 2' in style_name:
-                    element['type'] = 'heading2'
-                elif 'heading 3' in style_name:
-                    element['type'] = 'heading3'
+                element['type'] = style['element_type']
             
             # Apply numbering/bullets
             if numbering:
@@ -299,17 +361,17 @@ class DocxToMarkdownConverter:
     def _process_table(self, table, content_elements):
         """Process a table element"""
         # Extract all rows
-        rows = table.findall('.//w:tr', self.namespaces)
+        rows = self._table_children(table, W_TR)
         
         # Check if it's a 1x1 table (one row, one cell)
         if len(rows) == 1:
-            cells = rows[0].findall('.//w:tc', self.namespaces)
+            cells = self._table_children(rows[0], W_TC)
             if len(cells) == 1:
                 # This is a 1x1 table, extract ALL its content as code
                 cell_text = []
-                for para in cells[0].findall('.//w:p', self.namespaces):
+                for para in cells[0].iter(W_P):
                     para_texts = []
-                    for text_elem in para.findall('.//w:t', self.namespaces):
+                    for text_elem in para.iter(W_T):
                         if text_elem.text:
                             para_texts.append(text_elem.text)
                     if para_texts:
@@ -332,15 +394,25 @@ class DocxToMarkdownConverter:
             # Multi-row table, process as regular table
             self._process_regular_table(table, content_elements)
     
+    def _table_children(self, parent, tag):
+        """Find rows or cells of a table, looking through sdt/customXml wrappers but not nested tables"""
+        found = []
+        for child in parent:
+            if child.tag == tag:
+                found.append(child)
+            elif child.tag in TABLE_WRAPPERS:
+                found.extend(self._table_children(child, tag))
+        return found
+    
     def _process_regular_table(self, table, content_elements):
         """Process a regular table (not 1x1)"""
         table_data = []
         
-        for row in table.findall('.//w:tr', self.namespaces):
+        for row in self._table_children(table, W_TR):
             row_data = []
-            for cell in row.findall('.//w:tc', self.namespaces):
+            for cell in self._table_children(row, W_TC):
                 cell_content = []
-                for para in cell.findall('.//w:p', self.namespaces):
+                for para in cell.iter(W_P):
                     para_text = self._extract_text_with_formatting(para)
                     if para_text:
                         cell_content.append(para_text)
@@ -357,9 +429,21 @@ class DocxToMarkdownConverter:
     def convert_to_markdown(self, content_elements, doc_name):
         """Convert content elements to markdown format with improved paragraph handling"""
         markdown_lines = []
+        last_line_blank = False
+        
+        def add_line(line):
+            # Collapse runs of empty lines as they are added
+            nonlocal last_line_blank
+            if line == '':
+                if last_line_blank:
+                    return
+                last_line_blank = True
+            else:
+                last_line_blank = False
+            markdown_lines.append(line)
         
         # Track list numbering - key is numId, value is counter per level
-        list_counters = {}
+        list_counters = defaultdict(dict)
         prev_element = None
         in_list_context = False
         
@@ -375,7 +459,7 @@ class DocxToMarkdownConverter:
                 if current_type == 'text' and element['content'].strip():
                     needs_extra_space = True
                     # Also reset list counters when we have a meaningful paragraph after a list
-                    list_counters = {}
+                    list_counters.clear()
                     in_list_context = False
             
             # If we're transitioning from non-list to list, check if we should continue or reset
@@ -387,33 +471,32 @@ class DocxToMarkdownConverter:
                     if any(phrase in text_lower for phrase in ['could instead:', 'might:', 'approach:', 'following:', 'these:']):
                         # This looks like a new list introduction, ensure we have fresh numbering
                         numId = element['formatting'].get('numId', 0)
-                        if numId in list_counters:
-                            del list_counters[numId]
+                        list_counters.pop(numId, None)
                         in_list_context = True
             
             # Add extra space before this element if needed
-            if needs_extra_space and markdown_lines and markdown_lines[-1] != '':
-                markdown_lines.append('')
+            if needs_extra_space and markdown_lines and not last_line_blank:
+                add_line('')
             
             if element['type'] == 'title':
                 # Main title (use single #)
-                markdown_lines.append(f"# {element['content']}")
-                markdown_lines.append('')
+                add_line(f"# {element['content']}")
+                add_line('')
                 
             elif element['type'] == 'heading1':
                 # Heading 1 (use ##)
-                markdown_lines.append(f"## {element['content']}")
-                markdown_lines.append('')
+                add_line(f"## {element['content']}")
+                add_line('')
                 
             elif element['type'] == 'heading2':
                 # Heading 2 (use ###)
-                markdown_lines.append(f"### {element['content']}")
-                markdown_lines.append('')
+                add_line(f"### {element['content']}")
+                add_line('')
                 
             elif element['type'] == 'heading3':
                 # Heading 3 (use ####)
-                markdown_lines.append(f"#### {element['content']}")
-                markdown_lines.append('')
+                add_line(f"#### {element['content']}")
+                add_line('')
                 
             elif element['type'] == 'numbered_list':
                 # Numbered list item
@@ -421,21 +504,15 @@ class DocxToMarkdownConverter:
                 numId = element['formatting'].get('numId', 0)
                 indent = '   ' * level
                 
-                # Initialize counters for this numId if needed
-                if numId not in list_counters:
-                    list_counters[numId] = {}
-                
                 # Initialize or increment counter for this level
-                if level not in list_counters[numId]:
-                    list_counters[numId][level] = 0
-                list_counters[numId][level] += 1
+                counters = list_counters[numId]
+                counters[level] = counters.get(level, 0) + 1
                 
                 # Clear higher level counters
-                for l in list(list_counters[numId].keys()):
-                    if l > level:
-                        del list_counters[numId][l]
+                for l in [l for l in counters if l > level]:
+                    del counters[l]
                 
-                markdown_lines.append(f"{indent}{list_counters[numId][level]}. {element['content']}")
+                add_line(f"{indent}{counters[level]}. {element['content']}")
                 in_list_context = True
                 
             elif element['type'] == 'bulleted_list':
@@ -443,25 +520,25 @@ class DocxToMarkdownConverter:
                 level = element['formatting'].get('level', 0)
                 indent = '   ' * level
                 
-                markdown_lines.append(f"{indent}- {element['content']}")
+                add_line(f"{indent}- {element['content']}")
                 in_list_context = True
                 
             elif element['type'] == 'text':
                 # Regular text
                 if element['content'].strip():
-                    markdown_lines.append(element['content'])
+                    add_line(element['content'])
                     # Only add blank line after text if it's not followed by a list
                     next_elem = content_elements[i + 1] if i + 1 < len(content_elements) else None
                     if next_elem and next_elem['type'] not in ['numbered_list', 'bulleted_list']:
-                        markdown_lines.append('')
+                        add_line('')
                 elif not in_list_context:
                     # Empty line outside of list context
-                    markdown_lines.append('')
+                    add_line('')
                     
             elif element['type'] == 'image':
                 # Image reference
-                markdown_lines.append(f"![{element['filename']}]({element['path']})")
-                markdown_lines.append('')
+                add_line(f"![{element['filename']}]({element['path']})")
+                add_line('')
                 
             elif element['type'] == 'code':
                 # Code block
@@ -471,39 +548,27 @@ class DocxToMarkdownConverter:
                 code = code.strip()
                 
                 # Add code block
-                markdown_lines.append(f"```{element['language']}")
-                markdown_lines.append(code)
-                markdown_lines.append("```")
-                markdown_lines.append('')
+                add_line(f"```{element['language']}")
+                add_line(code)
+                add_line("```")
+                add_line('')
                 
             elif element['type'] == 'table':
                 # Markdown table
                 if element['data']:
                     # Add table headers (first row)
-                    markdown_lines.append('| ' + ' | '.join(element['data'][0]) + ' |')
+                    add_line('| ' + ' | '.join(element['data'][0]) + ' |')
                     # Add separator
-                    markdown_lines.append('| ' + ' | '.join(['---' for _ in element['data'][0]]) + ' |')
+                    add_line('| ' + ' | '.join(['---' for _ in element['data'][0]]) + ' |')
                     # Add remaining rows
                     for row in element['data'][1:]:
-                        markdown_lines.append('| ' + ' | '.join(row) + ' |')
-                    markdown_lines.append('')
+                        add_line('| ' + ' | '.join(row) + ' |')
+                    add_line('')
             
             # Update previous element
             prev_element = element
         
-        # Clean up any duplicate empty lines
-        cleaned_lines = []
-        prev_empty = False
-        for line in markdown_lines:
-            if line == '':
-                if not prev_empty:
-                    cleaned_lines.append(line)
-                prev_empty = True
-            else:
-                cleaned_lines.append(line)
-                prev_empty = False
-        
-        return '\n'.join(cleaned_lines)
+        return '\n'.join(markdown_lines)
     
     def convert_file(self, docx_path):
         """Convert a single .docx file to markdown"""
@@ -531,8 +596,8 @@ class DocxToMarkdownConverter:
             import traceback
             traceback.print_exc()
     
-    def convert_all(self):
-        """Convert all .docx files in the source directory"""
+    def convert_all(self, max_workers=None):
+        """Convert all .docx files in the source directory using a process pool"""
         docx_files = sorted(self.source_dir.glob("*.docx"))
         
         if not docx_files:
@@ -541,8 +606,28 @@ class DocxToMarkdownConverter:
         
         print(f"Found {len(docx_files)} files to convert")
         
-        for docx_file in docx_files:
-            self.convert_file(docx_file)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_convert_file_worker, self.source_dir, self.output_dir, self.images_dir, docx_file)
+                for docx_file in docx_files
+            ]
+            # Replay each file's output in order once it is done, keeping stdout and stderr apart
+            for docx_file, future in zip(docx_files, futures):
+                try:
+                    out, err = future.result()
+                except BrokenProcessPool:
+                    print(f"\nProcessing: {docx_file.name}")
+                    print(f"  Error converting {docx_file.name}: worker process terminated abruptly")
+                    continue
+                sys.stdout.write(out)
+                sys.stderr.write(err)
+
+def _convert_file_worker(source_dir, output_dir, images_dir, docx_path):
+    """Convert one file with a fresh converter in a worker process, returning its stdout and stderr"""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        DocxToMarkdownConverter(source_dir, output_dir, images_dir).convert_file(docx_path)
+    return out.getvalue(), err.getvalue()
 
 def main():
     # Setup directories